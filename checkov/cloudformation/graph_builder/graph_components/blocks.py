@@ -56,6 +56,7 @@ class CloudformationBlock(Block):
                 obj_to_update[key_to_update] = attribute_value
             else:
                 logging.info(f"Failed to update an attribute, values: {obj_to_update}, {key_to_update}, {attribute_value}")
+        self.invalidate_attribute_dict_cache()
 
     @staticmethod
     def _should_add_previous_breadcrumbs(change_origin_id: Optional[int],
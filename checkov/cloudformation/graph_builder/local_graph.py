@@ -145,6 +145,7 @@ class CloudformationLocalGraph(LocalGraph):
                     breadcrumb_data['attribute_key'] = breadcrumb.attribute_key
                     hash_breadcrumbs.append(breadcrumb_data)
                 vertex.breadcrumbs[attribute_key] = hash_breadcrumbs
+                vertex.invalidate_attribute_dict_cache()
 
     def _add_resource_attr_connections(self, attribute):
         if attribute not in self.SUPPORTED_RESOURCE_ATTR_CONNECTION_KEYS:
@@ -1,4 +1,4 @@
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, FrozenSet
 
 from checkov.common.graph.checks_infra.enums import Operators
 from checkov.common.checks_infra.solvers.attribute_solvers.base_attribute_solver import BaseAttributeSolver
@@ -9,6 +9,20 @@ class WithinAttributeSolver(BaseAttributeSolver):
 
     def __init__(self, resource_types: List[str], attribute: Optional[str], value: Any) -> None:
         super().__init__(resource_types=resource_types, attribute=attribute, value=value)
+        self._value_set: Optional[FrozenSet[Any]] = None
+        if isinstance(value, (list, tuple, set, frozenset)):
+            try:
+                self._value_set = frozenset(value)
+            except TypeError:
+                # unhashable elements, keep the sequential lookup
+                pass
 
     def _get_operation(self, vertex: Dict[str, Any], attribute: Optional[str]) -> bool:
-        return vertex.get(attribute) in self.value
+        attribute_value = vertex.get(attribute)
+        if self._value_set is not None:
+            try:
+                return attribute_value in self._value_set
+            except TypeError:
+                # the vertex value itself is unhashable, e.g. a list or dict
+                pass
+        return attribute_value in self.value
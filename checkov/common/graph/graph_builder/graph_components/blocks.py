@@ -1,8 +1,9 @@
 from copy import deepcopy
-from typing import Union, Dict, Any, List, Optional
+from itertools import accumulate
+from typing import Union, Dict, Any, List, Optional, Tuple
 
 from checkov.common.graph.graph_builder.graph_components.attribute_names import CustomAttributes
-from checkov.common.graph.graph_builder.utils import calculate_hash, join_trimmed_strings
+from checkov.common.graph.graph_builder.utils import calculate_hash
 from checkov.common.graph.graph_builder.variable_rendering.breadcrumb_metadata import BreadcrumbMetadata
 
 
@@ -16,6 +17,7 @@ class Block:
             attributes: Dict[str, Any],
             id: str = "",
             source: str = "",
+            copy_config: bool = True,
     ) -> None:
         """
             :param name: unique name given to the block, for example
@@ -23,9 +25,10 @@ class Block:
             :param path: the file location of the block
             :param block_type: str
             :param attributes: dictionary of the block's original attributes in the origin file
+            :param copy_config: whether to deep copy the config, can be disabled if the caller passes a private copy
         """
         self.name = name
-        self.config = deepcopy(config)
+        self.config = deepcopy(config) if copy_config else config
         self.path = path
         self.block_type = block_type
         self.attributes = attributes
@@ -33,17 +36,22 @@ class Block:
         self.source = source
         self.changed_attributes: Dict[str, List[Any]] = {}
         self.breadcrumbs: Dict[str, List[Dict[str, Any]]] = {}
+        self._label = f"{block_type}: {name}"
+        # the caches are stored together with the attributes version they were built for,
+        # so a build, which overlaps with an update, is never served afterwards
+        self._attributes_version = 0
+        self._attribute_dict_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._hash_cache: Optional[Tuple[int, str]] = None
 
         attributes_to_add = self._extract_inner_attributes()
         self.attributes.update(attributes_to_add)
 
     def _extract_inner_attributes(self) -> Dict[str, Any]:
         attributes_to_add = {}
-        for attribute_key in self.attributes:
-            attribute_value = self.attributes[attribute_key]
-            if isinstance(attribute_value, dict) or (
-                    isinstance(attribute_value, list) and len(attribute_value) > 0 and isinstance(attribute_value[0],
-                                                                                                  dict)):
+        for attribute_key, attribute_value in self.attributes.items():
+            if not isinstance(attribute_value, (dict, list)):
+                continue
+            if isinstance(attribute_value, dict) or (attribute_value and isinstance(attribute_value[0], dict)):
                 inner_attributes = self.get_inner_attributes(
                     attribute_key=attribute_key,
                     attribute_value=attribute_value,
@@ -52,7 +60,7 @@ class Block:
         return attributes_to_add
 
     def __str__(self) -> str:
-        return f"{self.block_type}: {self.name}"
+        return self._label
 
     def get_attribute_dict(self, add_hash=True) -> Dict[str, Any]:
         """
@@ -60,34 +68,44 @@ class Block:
            combined with the attributes generated by the module builder.
            If the attributes are not a primitive type, they are converted to strings.
            """
+        attribute_dict = dict(self._get_cached_attribute_dict())
+        if add_hash:
+            attribute_dict[CustomAttributes.HASH] = self.get_hash()
+
+        return attribute_dict
+
+    def _get_cached_attribute_dict(self) -> Dict[str, Any]:
+        version = self._attributes_version
+        cache = self._attribute_dict_cache
+        if cache is not None and cache[0] == version:
+            return cache[1]
+
         base_attributes = self.get_base_attributes()
         self.get_origin_attributes(base_attributes)
 
-        if self.changed_attributes:
-            # add changed attributes only for calculating the hash
-            base_attributes["changed_attributes"] = sorted(self.changed_attributes.keys())
-
         if self.breadcrumbs:
             sorted_breadcrumbs = dict(sorted(self.breadcrumbs.items()))
             base_attributes[CustomAttributes.RENDERING_BREADCRUMBS] = sorted_breadcrumbs
 
-        if add_hash:
-            base_attributes[CustomAttributes.HASH] = calculate_hash(base_attributes)
-
-        if "changed_attributes" in base_attributes:
-            # removed changed attributes if it was added previously for calculating hash.
-            del base_attributes["changed_attributes"]
-
+        self._attribute_dict_cache = (version, base_attributes)
         return base_attributes
 
+    def invalidate_attribute_dict_cache(self) -> None:
+        """
+        Has to be called after the block's attributes, config or breadcrumbs were changed from the outside
+        """
+        self._attributes_version += 1
+        self._attribute_dict_cache = None
+        self._hash_cache = None
+
     def get_origin_attributes(self, base_attributes: Dict[str, Any]) -> None:
-        for attribute_key in list(self.attributes.keys()):
-            attribute_value = self.attributes[attribute_key]
-            if isinstance(attribute_value, list) and len(attribute_value) == 1:
-                attribute_value = attribute_value[0]
+        for attribute_key, attribute_value in list(self.attributes.items()):
             if isinstance(attribute_value, (list, dict)):
-                inner_attributes = self.get_inner_attributes(attribute_key, attribute_value)
-                base_attributes.update(inner_attributes)
+                if isinstance(attribute_value, list) and len(attribute_value) == 1:
+                    attribute_value = attribute_value[0]
+                if isinstance(attribute_value, (list, dict)):
+                    inner_attributes = self.get_inner_attributes(attribute_key, attribute_value)
+                    base_attributes.update(inner_attributes)
             if attribute_key == "self":
                 base_attributes["self_"] = attribute_value
                 continue
@@ -95,8 +113,23 @@ class Block:
                 base_attributes[attribute_key] = attribute_value
 
     def get_hash(self) -> str:
-        attributes_dict = self.get_attribute_dict()
-        return attributes_dict.get(CustomAttributes.HASH, "")
+        version = self._attributes_version
+        cache = self._hash_cache
+        if cache is not None and cache[0] == version:
+            return cache[1]
+
+        hash_attributes = self._get_cached_attribute_dict()
+        if self.changed_attributes:
+            # add changed attributes only for calculating the hash, they are placed before the breadcrumbs
+            hash_attributes = dict(hash_attributes)
+            breadcrumbs = hash_attributes.pop(CustomAttributes.RENDERING_BREADCRUMBS, None)
+            hash_attributes["changed_attributes"] = sorted(self.changed_attributes.keys())
+            if breadcrumbs is not None:
+                hash_attributes[CustomAttributes.RENDERING_BREADCRUMBS] = breadcrumbs
+
+        attributes_hash = calculate_hash(hash_attributes)
+        self._hash_cache = (version, attributes_hash)
+        return attributes_hash
 
     def update_attribute(
             self, attribute_key: str, attribute_value: Any, change_origin_id: Optional[int],
@@ -115,14 +148,19 @@ class Block:
             self.attributes[attribute_key] = attribute_value
             if self._should_set_changed_attributes(change_origin_id, attribute_at_dest):
                 self.changed_attributes[attribute_key] = previous_breadcrumbs
+            self.invalidate_attribute_dict_cache()
             return
-        for i in range(len(attribute_key_parts)):
-            key = join_trimmed_strings(char_to_join=".", str_lst=attribute_key_parts, num_to_trim=i)
-            if key.find(".") > -1:
-                self.attributes[key] = attribute_value
-                attribute_value = {attribute_key_parts[len(attribute_key_parts) - 1 - i]: attribute_value}
-                if self._should_set_changed_attributes(change_origin_id, attribute_at_dest):
-                    self.changed_attributes[key] = previous_breadcrumbs
+
+        # all dotted prefixes of the key, e.g. 'a.b.c' -> ['a', 'a.b', 'a.b.c']
+        key_prefixes = list(accumulate(attribute_key_parts, lambda prefix, part: f"{prefix}.{part}"))
+        should_set_changed_attributes = self._should_set_changed_attributes(change_origin_id, attribute_at_dest)
+        for idx in range(len(attribute_key_parts) - 1, 0, -1):
+            key = key_prefixes[idx]
+            self.attributes[key] = attribute_value
+            attribute_value = {attribute_key_parts[idx]: attribute_value}
+            if should_set_changed_attributes:
+                self.changed_attributes[key] = previous_breadcrumbs
+        self.invalidate_attribute_dict_cache()
 
     @staticmethod
     def _should_add_previous_breadcrumbs(change_origin_id: Optional[int],
@@ -142,7 +180,7 @@ class Block:
             CustomAttributes.BLOCK_TYPE: self.block_type,
             CustomAttributes.FILE_PATH: self.path,
             CustomAttributes.CONFIG: self.config,
-            CustomAttributes.LABEL: str(self),
+            CustomAttributes.LABEL: self._label,
             CustomAttributes.ID: self.id,
             CustomAttributes.SOURCE: self.source,
         }
@@ -155,21 +193,33 @@ class Block:
     ) -> Dict[str, Any]:
         inner_attributes: Dict[str, Any] = {}
 
-        if isinstance(attribute_value, (dict, list)):
-            inner_attributes[attribute_key] = [None] * len(attribute_value) if isinstance(attribute_value, list) else {}
-            iterator: Union[range, List[str]] = range(len(attribute_value)) if isinstance(
-                attribute_value, list
-            ) else list(
-                attribute_value.keys()
-            )
-            for key in iterator:
-                if key != "":
-                    inner_key = f"{attribute_key}.{key}"
-                    inner_value = attribute_value[key]
-                    inner_attributes.update(cls.get_inner_attributes(inner_key, inner_value))
-                    inner_attributes[attribute_key][key] = inner_attributes[inner_key]
-                else:
-                    del attribute_value[key]
-        else:
-            inner_attributes[attribute_key] = attribute_value
+        # (key, value, parent container, key in parent container), popped in the same depth-first order
+        # the recursive implementation used to add them, to keep the attribute order and therefore the hash stable
+        stack: List[Tuple[str, Any, Any, Any]] = [(attribute_key, attribute_value, None, None)]
+        while stack:
+            key, value, parent, parent_key = stack.pop()
+            value = cls._get_inner_attribute_value(value)
+            if not isinstance(value, (dict, list)):
+                inner_value: Any = value
+            elif isinstance(value, dict):
+                if "" in value:
+                    del value[""]
+                inner_value = {}
+                prefix = f"{key}."
+                stack.extend((f"{prefix}{k}", value[k], inner_value, k) for k in reversed(list(value)))
+            else:
+                inner_value = [None] * len(value)
+                prefix = f"{key}."
+                stack.extend((prefix + str(idx), value[idx], inner_value, idx) for idx in reversed(range(len(value))))
+
+            inner_attributes[key] = inner_value
+            if parent is not None:
+                parent[parent_key] = inner_value
         return inner_attributes
+
+    @classmethod
+    def _get_inner_attribute_value(cls, attribute_value: Any) -> Any:
+        """
+        Hook to adjust each (nested) value before it is flattened by get_inner_attributes
+        """
+        return attribute_value
@@ -2,7 +2,16 @@
 from checkov.common.models.enums import CheckCategories, CheckResult
 from checkov.kubernetes.checks.resource.base_spec_check import BaseK8Check
 
-strongCiphers = ["TLS_ECDHE_ECDSA_WITH_AES_128_GCM_SHA256","TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256","TLS_ECDHE_ECDSA_WITH_CHACHA20_POLY1305","TLS_ECDHE_RSA_WITH_AES_256_GCM_SHA384","TLS_ECDHE_RSA_WITH_CHACHA20_POLY1305","TLS_ECDHE_ECDSA_WITH_AES_256_GCM_SHA384","TLS_RSA_WITH_AES_256_GCM_SHA384","TLS_RSA_WITH_AES_128_GCM_SHA256"]
+STRONG_CIPHERS = frozenset({
+    "TLS_ECDHE_ECDSA_WITH_AES_128_GCM_SHA256",
+    "TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256",
+    "TLS_ECDHE_ECDSA_WITH_CHACHA20_POLY1305",
+    "TLS_ECDHE_RSA_WITH_AES_256_GCM_SHA384",
+    "TLS_ECDHE_RSA_WITH_CHACHA20_POLY1305",
+    "TLS_ECDHE_ECDSA_WITH_AES_256_GCM_SHA384",
+    "TLS_RSA_WITH_AES_256_GCM_SHA384",
+    "TLS_RSA_WITH_AES_128_GCM_SHA256",
+})
 
 
 class ApiServerStrongCryptographicCiphers(BaseK8Check):
@@ -18,14 +27,30 @@ class ApiServerStrongCryptographicCiphers(BaseK8Check):
 
     def scan_spec_conf(self, conf):
         if "command" in conf:
-            if "kube-apiserver" in conf["command"]:
-                for command in conf["command"]:
-                    if command.startswith("--tls-cipher-suites"):
-                        value = command.split("=")[1]    
-                        ciphers = value.split(",")
-                        for cipher in ciphers:
-                            if cipher not in strongCiphers:
-                                return CheckResult.FAILED
+            is_api_server = False
+            has_weak_cipher = False
+            commands = iter(conf["command"])
+            for command in commands:
+                if not isinstance(command, str):
+                    # yaml can parse command arguments into other types, e.g. 'sleep 3600'
+                    continue
+                if command == "kube-apiserver":
+                    is_api_server = True
+                elif command.startswith("--tls-cipher-suites"):
+                    flag, _, ciphers = command.partition("=")
+                    if flag != "--tls-cipher-suites":
+                        continue
+                    if command == flag:
+                        # the value is passed as the next argument, e.g. '--tls-cipher-suites TLS_RSA_WITH_RC4_128_SHA'
+                        ciphers = next(commands, None)
+                        if not isinstance(ciphers, str):
+                            continue
+                    # the flag can be repeated, every occurrence adds to the list of ciphers
+                    if any(cipher not in STRONG_CIPHERS for cipher in ciphers.split(",")):
+                        has_weak_cipher = True
+
+                if is_api_server and has_weak_cipher:
+                    return CheckResult.FAILED
 
         return CheckResult.PASSED
 
@@ -13,6 +13,8 @@ class KubernetesBlock(Block):
             config: Dict[str, Any],
             path: str,
             attributes: Dict[str, Any],
+            copy_config: bool = True,
     ) -> None:
         block_name = f'{resource_type}.{namespace}.{name}'
-        super().__init__(block_name, config, path, BlockType.RESOURCE, attributes, block_name, 'Kubernetes')
+        super().__init__(block_name, config, path, BlockType.RESOURCE, attributes, block_name, 'Kubernetes',
+                         copy_config)
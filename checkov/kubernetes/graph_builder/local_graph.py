@@ -43,7 +43,8 @@ class KubernetesLocalGraph(LocalGraph):
                     resource_type=resource_type,
                     config=config,
                     path=file_path,
-                    attributes=attributes
+                    attributes=attributes,
+                    copy_config=False,
                 ))
 
         for i, vertex in enumerate(self.vertices):
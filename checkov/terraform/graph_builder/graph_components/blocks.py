@@ -1,40 +1,42 @@
-import os
-from typing import Union, Dict, Any, List, Optional, Set
+from collections import defaultdict
+from typing import Union, Dict, Any, List, Optional, Set, DefaultDict, Callable
 
 from checkov.common.graph.graph_builder.graph_components.blocks import Block
 from checkov.common.graph.graph_builder.variable_rendering.breadcrumb_metadata import BreadcrumbMetadata
 from checkov.common.util.consts import RESOLVED_MODULE_ENTRY_NAME
 from checkov.terraform.graph_builder.graph_components.block_types import BlockType
-from checkov.terraform.graph_builder.utils import remove_module_dependency_in_path
+from checkov.terraform.graph_builder.utils import remove_module_dependency_in_path, get_realpath
 
 
 class TerraformBlock(Block):
     def __init__(self, name: str, config: Dict[str, Any], path: str, block_type: BlockType, attributes: Dict[str, Any],
-                 id: str = "", source: str = "") -> None:
+                 id: str = "", source: str = "", copy_config: bool = True) -> None:
         """
             :param name: unique name given to the terraform block, for example: 'aws_vpc.example_name'
             :param config: the section in tf_definitions that belong to this block
             :param path: the file location of the block
             :param block_type: BlockType
             :param attributes: dictionary of the block's original attributes in the terraform file
+            :param copy_config: whether to deep copy the config, can be disabled if the caller passes a private copy
         """
-        super(TerraformBlock, self).__init__(name, config, path, block_type, attributes, id, source)
+        super(TerraformBlock, self).__init__(name, config, path, block_type, attributes, id, source, copy_config)
         self.module_dependency = ""
         self.module_dependency_num = ""
         if path:
             self.path, module_dependency, num = remove_module_dependency_in_path(path)
-            self.path = os.path.realpath(self.path)
+            self.path = get_realpath(self.path)
             if module_dependency:
                 self.module_dependency = module_dependency
                 self.module_dependency_num = num
         if attributes.get(RESOLVED_MODULE_ENTRY_NAME):
             del attributes[RESOLVED_MODULE_ENTRY_NAME]
         self.attributes = attributes
-        self.module_connections: Dict[str, List[int]] = {}
+        self.module_connections: DefaultDict[str, List[int]] = defaultdict(list)
         self.source_module: Set[int] = set()
+        self._find_block_type_attribute = self._block_type_to_find_attribute_func.get(block_type)
 
     def add_module_connection(self, attribute_key: str, vertex_id: int) -> None:
-        self.module_connections.setdefault(attribute_key, []).append(vertex_id)
+        self.module_connections[attribute_key].append(vertex_id)
 
     def find_attribute(self, attribute: Optional[Union[str, List[str]]]) -> Optional[str]:
         """
@@ -49,13 +51,19 @@ class TerraformBlock(Block):
         if self.attributes.get(attribute[0]):
             return attribute[0]
 
-        if self.block_type == BlockType.VARIABLE:
-            return "default" if self.attributes.get("default") else None
+        if self._find_block_type_attribute:
+            return self._find_block_type_attribute(self, attribute)
 
-        if self.block_type == BlockType.OUTPUT:
-            return "value" if self.attributes.get("value") else None
+        return None
+
+    def _find_variable_attribute(self, attribute: Union[str, List[str]]) -> Optional[str]:
+        return "default" if self.attributes.get("default") else None
+
+    def _find_output_attribute(self, attribute: Union[str, List[str]]) -> Optional[str]:
+        return "value" if self.attributes.get("value") else None
 
-        if self.block_type == BlockType.RESOURCE and len(attribute) > 1:
+    def _find_resource_attribute(self, attribute: Union[str, List[str]]) -> Optional[str]:
+        if len(attribute) > 1:
             # handle cases where attribute_at_dest == ['aws_s3_bucket.template_bucket', 'acl']
             if self.name == attribute[0] and self.attributes.get(attribute[1]):
                 return attribute[1]
@@ -72,9 +80,7 @@ class TerraformBlock(Block):
     def update_inner_attribute(
         self, attribute_key: str, nested_attributes: Union[List[Any], Dict[str, Any]], value_to_update: Any
     ) -> None:
-        split_key = attribute_key.split(".")
-        i = 1
-        curr_key = ".".join(split_key[0:i])
+        curr_key, sep, rest_key = attribute_key.partition(".")
         if isinstance(nested_attributes, list):
             if curr_key.isnumeric():
                 curr_key_int = int(curr_key)
@@ -82,33 +88,34 @@ class TerraformBlock(Block):
                     if not isinstance(nested_attributes[curr_key_int], dict):
                         nested_attributes[curr_key_int] = value_to_update
                     else:
-                        self.update_inner_attribute(
-                            ".".join(split_key[i:]), nested_attributes[curr_key_int], value_to_update
-                        )
+                        self.update_inner_attribute(rest_key, nested_attributes[curr_key_int], value_to_update)
             else:
                 for inner in nested_attributes:
                     self.update_inner_attribute(curr_key, inner, value_to_update)
         elif isinstance(nested_attributes, dict):
-            while curr_key not in nested_attributes and i <= len(split_key):
-                i += 1
-                curr_key = ".".join(split_key[0:i])
+            is_single_key = not sep
+            # keys can contain dots themselves, therefore extend the key part by part until it matches
+            while curr_key not in nested_attributes and sep:
+                next_key, sep, rest_key = rest_key.partition(".")
+                curr_key = f"{curr_key}.{next_key}"
             if attribute_key in nested_attributes.keys():
                 nested_attributes[attribute_key] = value_to_update
-            if len(split_key) == 1 and len(curr_key) > 0:
+            if is_single_key and len(curr_key) > 0:
                 nested_attributes[curr_key] = value_to_update
             elif curr_key in nested_attributes.keys():
-                self.update_inner_attribute(".".join(split_key[i:]), nested_attributes[curr_key], value_to_update)
+                self.update_inner_attribute(rest_key, nested_attributes[curr_key], value_to_update)
+        self.invalidate_attribute_dict_cache()
 
     @classmethod
-    def get_inner_attributes(
-        cls,
-        attribute_key: str,
-        attribute_value: Union[str, List[str], Dict[str, Any]],
-    ) -> Dict[str, Any]:
+    def _get_inner_attribute_value(cls, attribute_value: Any) -> Any:
         if isinstance(attribute_value, list) and len(attribute_value) == 1:
-            attribute_value = attribute_value[0]
+            return attribute_value[0]
+        return attribute_value
 
-        return super().get_inner_attributes(
-            attribute_key=attribute_key,
-            attribute_value=attribute_value,
-        )
+    _block_type_to_find_attribute_func: Dict[
+        BlockType, Callable[["TerraformBlock", Union[str, List[str]]], Optional[str]]
+    ] = {
+        BlockType.OUTPUT: _find_output_attribute,
+        BlockType.RESOURCE: _find_resource_attribute,
+        BlockType.VARIABLE: _find_variable_attribute,
+    }
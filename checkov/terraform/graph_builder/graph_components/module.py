@@ -144,14 +144,17 @@ class Module:
                     if provisioner:
                         self._handle_provisioner(provisioner, attributes)
                     attributes["resource_type"] = [resource_type]
+                    config = self.clean_bad_characters(resource_dict)
                     resource_block = TerraformBlock(
                         block_type=BlockType.RESOURCE,
                         name=f"{resource_type}.{name}",
-                        config=self.clean_bad_characters(resource_dict),
+                        config=config,
                         path=path,
                         attributes=attributes,
                         id=f"{resource_type}.{name}",
                         source=self.source,
+                        # the cleaned config is already a private copy, unless cleaning failed
+                        copy_config=config is resource_dict,
                     )
                     self._add_to_blocks(resource_block)
 
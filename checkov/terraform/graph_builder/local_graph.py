@@ -22,7 +22,7 @@ from checkov.terraform.graph_builder.utils import (
     filter_sub_keys,
     attribute_has_nested_attributes, remove_index_pattern_from_str,
 )
-from checkov.terraform.graph_builder.utils import is_local_path
+from checkov.terraform.graph_builder.utils import is_local_path, get_realpath
 from checkov.terraform.graph_builder.variable_rendering.renderer import TerraformVariableRenderer
 
 MODULE_RESERVED_ATTRIBUTES = ("source", "version")
@@ -323,7 +323,7 @@ class TerraformLocalGraph(LocalGraph):
         longest_common_prefix = ""
         for vertex_index in relevant_vertices_indexes:
             vertex = self.vertices[vertex_index]
-            common_prefix = os.path.commonpath([os.path.realpath(vertex.path), os.path.realpath(origin_path)])
+            common_prefix = os.path.commonpath([get_realpath(vertex.path), get_realpath(origin_path)])
             if len(common_prefix) > len(longest_common_prefix):
                 vertex_index_with_longest_common_prefix = vertex_index
                 longest_common_prefix = common_prefix
@@ -392,6 +392,7 @@ class TerraformLocalGraph(LocalGraph):
             if vertex.block_type == BlockType.LOCALS:
                 updated_config = updated_config.get(vertex.name)
             update_dictionary_attribute(vertex.config, vertex.name, updated_config)
+            vertex.invalidate_attribute_dict_cache()
 
     def get_resources_types_in_graph(self) -> List[str]:
         return self.module.get_resources_types()
@@ -412,6 +413,7 @@ class TerraformLocalGraph(LocalGraph):
                     breadcrumb["module_connection"] = self._determine_if_module_connection(breadcrumbs_list, v)
                     hash_breadcrumbs.append(breadcrumb)
                 vertex.breadcrumbs[attribute_key] = hash_breadcrumbs
+                vertex.invalidate_attribute_dict_cache()
             if len(vertex.source_module) == 1:
                 m = self.vertices[list(vertex.source_module)[0]]
                 source_module_data = [m.get_export_data()]
@@ -420,6 +422,7 @@ class TerraformLocalGraph(LocalGraph):
                     source_module_data.append(m.get_export_data())
                 source_module_data.reverse()
                 vertex.breadcrumbs[CustomAttributes.SOURCE_MODULE] = source_module_data
+                vertex.invalidate_attribute_dict_cache()
 
     @staticmethod
     def _determine_if_module_connection(breadcrumbs_list: List[int], vertex_in_breadcrumbs: TerraformBlock) -> bool:
@@ -448,6 +451,7 @@ class TerraformLocalGraph(LocalGraph):
                     EncryptionValues.ENCRYPTED.value if is_encrypted else EncryptionValues.UNENCRYPTED.value
                 )
                 vertex.attributes[CustomAttributes.ENCRYPTION_DETAILS] = reason
+                vertex.invalidate_attribute_dict_cache()
 
     def get_dirname(self, path: str) -> str:
         dir_name = self.dirname_cache.get(path)
@@ -1,5 +1,6 @@
 import os
 import re
+from functools import lru_cache
 from typing import Tuple
 from typing import Union, List, Any, Dict, Optional, Callable
 
@@ -20,18 +21,35 @@ def is_local_path(root_dir: str, source: str) -> bool:
     )
 
 
+@lru_cache(maxsize=4096)
 def remove_module_dependency_in_path(path: str) -> Tuple[str, str, str]:
     """
     :param path: path that looks like "dir/main.tf[other_dir/x.tf#0]
     :return: separated path from module dependency: dir/main.tf, other_dir/x.tf
     """
     module_dependency = re.findall(MODULE_DEPENDENCY_PATTERN_IN_PATH, path)
-    if re.findall(MODULE_DEPENDENCY_PATTERN_IN_PATH, path):
+    if module_dependency:
         path = re.sub(MODULE_DEPENDENCY_PATTERN_IN_PATH, "", path)
     module_and_num = extract_module_dependency_path(module_dependency)
     return path, module_and_num[0], module_and_num[1]
 
 
+def get_realpath(path: str) -> str:
+    """
+    :param path: path of a file or directory
+    :return: the canonical path, absolute paths are cached, because many blocks share the same file
+    """
+    if os.path.isabs(path):
+        return _get_cached_realpath(path)
+    # relative paths depend on the current working directory and can't be cached
+    return os.path.realpath(path)
+
+
+@lru_cache(maxsize=4096)
+def _get_cached_realpath(path: str) -> str:
+    return os.path.realpath(path)
+
+
 def extract_module_dependency_path(module_dependency: List[str]) -> List[str]:
     """
     :param module_dependency: a list looking like ['[path_to_module.tf#0]']
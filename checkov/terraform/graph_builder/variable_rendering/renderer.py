@@ -263,6 +263,7 @@ class TerraformVariableRenderer(VariableRenderer):
                     lst_curr_val = [lst_curr_val]
                 if len(lst_curr_val) > 0 and isinstance(lst_curr_val[0], Tree):
                     lst_curr_val[0] = str(lst_curr_val[0])
+                    vertex.invalidate_attribute_dict_cache()
                 evaluated_lst = []
                 for inner_val in lst_curr_val:
                     if (
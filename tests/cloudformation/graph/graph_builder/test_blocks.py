@@ -2,6 +2,7 @@ from unittest import TestCase
 
 from checkov.cloudformation.graph_builder.graph_components.block_types import BlockType
 from checkov.cloudformation.graph_builder.graph_components.blocks import CloudformationBlock
+from checkov.common.graph.graph_builder import CustomAttributes
 
 
 class TestBlocks(TestCase):
@@ -18,3 +19,18 @@ class TestBlocks(TestCase):
         block.update_attribute(attribute_key="labels.app.kubernetes.io/name", change_origin_id=0,
                                            attribute_value="dummy value", previous_breadcrumbs=[], attribute_at_dest="")
         self.assertEqual("dummy value", block.attributes["labels.app.kubernetes.io/name"])
+
+    def test_update_attribute_resets_cached_attribute_dict_and_hash(self):
+        config = {'BucketName': 'bucket', 'Tags': [{'Key': 'Name', 'Value': 'test'}]}
+        attributes = {'BucketName': 'bucket', 'Tags': [{'Key': 'Name', 'Value': 'test'}]}
+        block = CloudformationBlock(name='AWS::S3::Bucket.Bucket', config=config, path='', block_type=BlockType.RESOURCE,
+                                    attributes=attributes)
+        hash_before = block.get_hash()
+        self.assertEqual('bucket', block.get_attribute_dict()['BucketName'])
+
+        block.update_attribute(attribute_key='BucketName', attribute_value='updated', change_origin_id=0,
+                               previous_breadcrumbs=[], attribute_at_dest='BucketName')
+
+        self.assertNotEqual(hash_before, block.get_hash())
+        self.assertEqual('updated', block.get_attribute_dict()['BucketName'])
+        self.assertEqual(block.get_hash(), block.get_attribute_dict()[CustomAttributes.HASH])
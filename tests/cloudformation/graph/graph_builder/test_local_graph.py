@@ -4,9 +4,11 @@ from unittest import TestCase
 
 from checkov.cloudformation.cfn_utils import create_definitions
 from checkov.cloudformation.graph_builder.graph_components.block_types import BlockType
+from checkov.cloudformation.graph_builder.graph_components.blocks import CloudformationBlock
 from checkov.cloudformation.graph_builder.graph_to_definitions import convert_graph_vertices_to_definitions
 from checkov.cloudformation.graph_builder.local_graph import CloudformationLocalGraph
 from checkov.cloudformation.parser import parse, TemplateSections
+from checkov.common.graph.graph_builder import CustomAttributes
 from checkov.runner_filter import RunnerFilter
 
 TEST_DIRNAME = os.path.dirname(os.path.realpath(__file__))
@@ -30,6 +32,25 @@ class TestLocalGraph(TestCase):
         self.assertDictEqual(definitions[relative_file_path]["Resources"]["Enabled"]["Properties"],
                              resource_vertex.attributes)
 
+    def test_update_vertices_breadcrumbs_resets_cached_hash(self):
+        local_graph = CloudformationLocalGraph({})
+        parameter = CloudformationBlock(name="BucketNameParam", config={"Default": "bucket"}, path="template.yaml",
+                                        block_type=BlockType.PARAMETERS, attributes={"Default": "bucket"})
+        resource = CloudformationBlock(name="AWS::S3::Bucket.Bucket", config={"BucketName": {"Ref": "BucketNameParam"}},
+                                       path="template.yaml", block_type=BlockType.RESOURCE,
+                                       attributes={"BucketName": {"Ref": "BucketNameParam"}})
+        local_graph.vertices.extend([parameter, resource])
+        resource.update_attribute(attribute_key="BucketName", attribute_value="bucket", change_origin_id=0,
+                                  previous_breadcrumbs=[], attribute_at_dest="Default")
+        hash_before = resource.get_hash()
+        self.assertNotIn(CustomAttributes.RENDERING_BREADCRUMBS, resource.get_attribute_dict())
+
+        local_graph.update_vertices_breadcrumbs()
+
+        self.assertNotEqual(hash_before, resource.get_hash())
+        breadcrumbs = resource.get_attribute_dict()[CustomAttributes.RENDERING_BREADCRUMBS]
+        self.assertEqual(["BucketNameParam"], [breadcrumb["name"] for breadcrumb in breadcrumbs["BucketName"]])
+
     def test_build_graph_with_params_outputs(self):
         relative_file_path = "../../checks/resource/aws/example_IAMRoleAllowAssumeFromAccount/example_IAMRoleAllowAssumeFromAccount-PASSED-2.yml"
         definitions = {}
@@ -1,5 +1,6 @@
 import os
 
+from checkov.common.checks_infra.solvers.attribute_solvers.within_attribute_solver import WithinAttributeSolver
 from tests.terraform.graph.checks_infra.test_base import TestBaseSolver
 
 TEST_DIRNAME = os.path.dirname(os.path.realpath(__file__))
@@ -18,3 +19,33 @@ class TestWithinSolver(TestBaseSolver):
         expected_results = {check_id: {"should_pass": should_pass, "should_fail": should_fail}}
 
         self.run_test(root_folder=root_folder, expected_results=expected_results, check_id=check_id)
+
+    def test_within_list_value(self):
+        solver = WithinAttributeSolver([], None, ["a", "b", 1])
+
+        self.assertTrue(solver._get_operation({'a': 'a'}, 'a'))
+        self.assertTrue(solver._get_operation({'a': 1}, 'a'))
+        self.assertFalse(solver._get_operation({'a': 'c'}, 'a'))
+        self.assertFalse(solver._get_operation({'a': '1'}, 'a'))
+        self.assertFalse(solver._get_operation({}, 'a'))
+
+    def test_within_string_value(self):
+        solver = WithinAttributeSolver([], None, "public_ip")
+
+        self.assertTrue(solver._get_operation({'a': 'public'}, 'a'))
+        self.assertTrue(solver._get_operation({'a': 'ip'}, 'a'))
+        self.assertFalse(solver._get_operation({'a': 'private'}, 'a'))
+
+    def test_within_unhashable_list_value(self):
+        solver = WithinAttributeSolver([], None, [["a"], {"b": 1}, "c"])
+
+        self.assertTrue(solver._get_operation({'a': ['a']}, 'a'))
+        self.assertTrue(solver._get_operation({'a': {'b': 1}}, 'a'))
+        self.assertTrue(solver._get_operation({'a': 'c'}, 'a'))
+        self.assertFalse(solver._get_operation({'a': ['b']}, 'a'))
+
+    def test_within_unhashable_vertex_value(self):
+        solver = WithinAttributeSolver([], None, ["a", "b"])
+
+        self.assertFalse(solver._get_operation({'a': ['a']}, 'a'))
+        self.assertFalse(solver._get_operation({'a': {'b': 1}}, 'a'))
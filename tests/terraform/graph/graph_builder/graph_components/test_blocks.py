@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from checkov.terraform.graph_builder.graph_components.attribute_names import CustomAttributes
 from checkov.terraform.graph_builder.graph_components.block_types import BlockType
 from checkov.terraform.graph_builder.graph_components.blocks import TerraformBlock
 
@@ -183,3 +184,50 @@ class TestBlocks(TestCase):
 
         self.assertEqual('', block.attributes[attribute_key],
                          f"failed to update provisioner/remote-exec.inline.3, got {block.attributes[attribute_key]}")
+
+    def test_update_attribute_resets_cached_attribute_dict_and_hash(self):
+        config = {'aws_s3_bucket': {'test': {'acl': ['private'], 'tags': [{'Name': 'test'}]}}}
+        block = TerraformBlock(name='aws_s3_bucket.test', config=config, path='test_path', block_type=BlockType.RESOURCE,
+                               attributes=config['aws_s3_bucket']['test'])
+        hash_before = block.get_hash()
+        self.assertEqual('private', block.get_attribute_dict()['acl'])
+
+        block.update_attribute(attribute_key='acl', attribute_value='public-read', change_origin_id=None,
+                               previous_breadcrumbs=[], attribute_at_dest=None)
+
+        self.assertNotEqual(hash_before, block.get_hash())
+        self.assertEqual('public-read', block.get_attribute_dict()['acl'])
+        self.assertEqual(block.get_hash(), block.get_attribute_dict()[CustomAttributes.HASH])
+
+    def test_update_inner_attribute_resets_cached_attribute_dict_and_hash(self):
+        config = {'aws_s3_bucket': {'test': {'acl': ['private'], 'tags': [{'Name': 'test'}]}}}
+        block = TerraformBlock(name='aws_s3_bucket.test', config=config, path='test_path', block_type=BlockType.RESOURCE,
+                               attributes=config['aws_s3_bucket']['test'])
+        hash_before = block.get_hash()
+        self.assertEqual({'Name': 'test'}, block.get_attribute_dict()['tags'])
+
+        block.update_inner_attribute(attribute_key='tags.Name', nested_attributes=block.attributes,
+                                     value_to_update='updated')
+
+        self.assertNotEqual(hash_before, block.get_hash())
+        self.assertEqual({'Name': 'updated'}, block.get_attribute_dict()['tags'])
+
+    def test_update_attribute_during_attribute_dict_rebuild(self):
+        config = {'aws_s3_bucket': {'test': {'acl': ['private'], 'tags': [{'Name': 'test'}]}}}
+        block = TerraformBlock(name='aws_s3_bucket.test', config=config, path='test_path', block_type=BlockType.RESOURCE,
+                               attributes=config['aws_s3_bucket']['test'])
+        get_origin_attributes = block.get_origin_attributes
+
+        def get_origin_attributes_and_update(base_attributes):
+            # simulates another thread updating the block while the attribute dict is rebuilt
+            get_origin_attributes(base_attributes)
+            del block.get_origin_attributes
+            block.update_attribute(attribute_key='acl', attribute_value='public-read', change_origin_id=None,
+                                   previous_breadcrumbs=[], attribute_at_dest=None)
+
+        block.get_origin_attributes = get_origin_attributes_and_update
+        stale_hash = block.get_hash()
+
+        self.assertEqual('public-read', block.get_attribute_dict()['acl'])
+        self.assertNotEqual(stale_hash, block.get_hash())
+        self.assertEqual(block.get_hash(), block.get_attribute_dict()[CustomAttributes.HASH])
@@ -32,6 +32,69 @@ class TestLocalGraph(TestCase):
         expected_config = {"resource_type": {"resource_name": {"attribute1": 1, "attribute2": 2, "resource_name": ["ok"]}}}
         self.assertDictEqual(expected_config, vertex.config)
 
+    def test_update_vertices_configs_resets_cached_hash(self):
+        config = {"resource_type": {"resource_name": {"attribute1": [1], "attribute2": [2]}}}
+        attributes = {"attribute1": [1], "attribute2": [2]}
+        local_graph = TerraformLocalGraph(None)
+        vertex = TerraformBlock(name="resource_type.resource_name", config=config, path='', block_type=BlockType.RESOURCE, attributes=attributes)
+        vertex.update_attribute("attribute1", 3, None, [], None)
+        local_graph.vertices.append(vertex)
+        hash_before = vertex.get_hash()
+
+        local_graph.update_vertices_configs()
+
+        self.assertEqual([3], vertex.config["resource_type"]["resource_name"]["attribute1"])
+        self.assertNotEqual(hash_before, vertex.get_hash())
+        self.assertEqual(vertex.config, vertex.get_attribute_dict()[CustomAttributes.CONFIG])
+
+    def test_update_vertices_breadcrumbs_resets_cached_hash(self):
+        local_graph = TerraformLocalGraph(None)
+        variable = TerraformBlock(name="var_name", config={"var_name": {"default": ["value"]}}, path="variables.tf",
+                                  block_type=BlockType.VARIABLE, attributes={"default": ["value"]})
+        resource = TerraformBlock(name="resource_type.resource_name", config={"resource_type": {"resource_name": {"attribute1": ["${var.var_name}"]}}},
+                                  path="main.tf", block_type=BlockType.RESOURCE, attributes={"attribute1": ["${var.var_name}"]})
+        local_graph.vertices.extend([variable, resource])
+        resource.update_attribute("attribute1", "value", 0, [], "default")
+        hash_before = resource.get_hash()
+        self.assertNotIn(CustomAttributes.RENDERING_BREADCRUMBS, resource.get_attribute_dict())
+
+        local_graph.update_vertices_breadcrumbs_and_module_connections()
+
+        self.assertNotEqual(hash_before, resource.get_hash())
+        breadcrumbs = resource.get_attribute_dict()[CustomAttributes.RENDERING_BREADCRUMBS]
+        self.assertEqual(["var_name"], [breadcrumb["name"] for breadcrumb in breadcrumbs["attribute1"]])
+
+    def test_update_vertices_source_module_resets_cached_hash(self):
+        local_graph = TerraformLocalGraph(None)
+        module = TerraformBlock(name="module_name", config={"module_name": {"source": ["./module"]}}, path="main.tf",
+                                block_type=BlockType.MODULE, attributes={"source": ["./module"]})
+        resource = TerraformBlock(name="resource_type.resource_name", config={"resource_type": {"resource_name": {"attribute1": ["value"]}}},
+                                  path="module/main.tf", block_type=BlockType.RESOURCE, attributes={"attribute1": ["value"]})
+        local_graph.vertices.extend([module, resource])
+        resource.source_module.add(0)
+        hash_before = resource.get_hash()
+        self.assertNotIn(CustomAttributes.RENDERING_BREADCRUMBS, resource.get_attribute_dict())
+
+        local_graph.update_vertices_breadcrumbs_and_module_connections()
+
+        self.assertNotEqual(hash_before, resource.get_hash())
+        breadcrumbs = resource.get_attribute_dict()[CustomAttributes.RENDERING_BREADCRUMBS]
+        self.assertEqual([module.get_export_data()], breadcrumbs[CustomAttributes.SOURCE_MODULE])
+
+    def test_calculate_encryption_attribute_resets_cached_hash(self):
+        local_graph = TerraformLocalGraph(None)
+        vertex = TerraformBlock(name="aws_ebs_volume.encrypted", config={"aws_ebs_volume": {"encrypted": {"encrypted": [True]}}}, path='',
+                                block_type=BlockType.RESOURCE, attributes={"encrypted": [True]}, id="aws_ebs_volume.encrypted")
+        local_graph.vertices.append(vertex)
+        local_graph.vertices_by_block_type[BlockType.RESOURCE].append(0)
+        hash_before = vertex.get_hash()
+        self.assertNotIn(CustomAttributes.ENCRYPTION, vertex.get_attribute_dict())
+
+        local_graph.calculate_encryption_attribute()
+
+        self.assertNotEqual(hash_before, vertex.get_hash())
+        self.assertEqual(EncryptionValues.ENCRYPTED.value, vertex.get_attribute_dict()[CustomAttributes.ENCRYPTION])
+
     def test_single_edge_with_same_label(self):
         resources_dir = os.path.realpath(
             os.path.join(TEST_DIRNAME, '../resources/k8_service'))